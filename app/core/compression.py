@@ -0,0 +1,168 @@
+# app/core/compression.py
+import zlib
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from app.core.config import Settings
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._c = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._c.compress(data) + self._c.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._c = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return self._c.compress(data) + self._c.flush(mode)
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Elige 'zstd' o 'gzip' según Accept-Encoding (respeta q=0). None si ninguno aplica."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token.strip())
+    if "zstd" in accepted:
+        return "zstd"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime respuestas con zstd o gzip. Las respuestas
+    completas por debajo de COMPRESSION_MIN_SIZE salen tal cual; las de
+    streaming (export) se comprimen chunk a chunk con flush, sin bufferizar
+    el cuerpo entero.
+    """
+
+    def __init__(self, app, settings: Settings):
+        self.app = app
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.levels = {"gzip": settings.COMPRESSION_GZIP_LEVEL, "zstd": settings.COMPRESSION_ZSTD_LEVEL}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.levels[encoding], self.min_size))
+
+class _CompressingSend:
+    def __init__(self, send, encoding: str, level: int, min_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.level = level
+        self.min_size = min_size
+        self.start_message = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            # se retiene hasta ver el primer chunk del body
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            return await self.send(message)
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            if "content-encoding" in headers or (not more_body and len(body) < self.min_size):
+                self.passthrough = True
+                await self.send(start)
+                return await self.send(message)
+            self.compressor = _Zstd(self.level) if self.encoding == "zstd" else _Gzip(self.level)
+            body = self.compressor.compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            start["headers"] = headers.raw
+            await self.send(start)
+        else:
+            body = self.compressor.compress(body, final=not more_body)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+# -------- bodies de petición con Content-Encoding --------
+REQUEST_ENCODINGS = ("gzip", "x-gzip", "zstd")
+
+class _RequestDecoder:
+    """Descompresión incremental del body; falla si el stream termina a mitad."""
+
+    def __init__(self, encoding: str, max_bytes: int):
+        if encoding == "zstd":
+            self._d = zstandard.ZstdDecompressor().decompressobj()
+        else:
+            self._d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.max_bytes = max_bytes
+        self.total = 0
+
+    def decompress(self, data: bytes, final: bool) -> bytes:
+        out = self._d.decompress(data) if data else b""
+        self.total += len(out)
+        if self.total > self.max_bytes:
+            raise ValueError(f"Body descomprimido supera {self.max_bytes} bytes")
+        if final and not self._d.eof:
+            raise ValueError("Body comprimido incompleto (truncado)")
+        return out
+
+class RequestDecompressionMiddleware:
+    """
+    Decodifica bodies con Content-Encoding gzip/zstd a nivel ASGI, antes de que
+    FastAPI parsee el multipart, chunk a chunk y sin bufferizar el body entero.
+    Otros encodings se rechazan con 415. Un body corrupto o truncado hace
+    fallar el parseo (400 de FastAPI).
+    """
+
+    def __init__(self, app, settings: Settings):
+        self.app = app
+        self.max_bytes = settings.REQUEST_MAX_DECODED_BYTES
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoding = Headers(scope=scope).get("content-encoding", "").strip().lower()
+        if not encoding or encoding == "identity":
+            return await self.app(scope, receive, send)
+        if encoding not in REQUEST_ENCODINGS:
+            response = JSONResponse(
+                {"detail": f"Content-Encoding '{encoding}' no soportado (usar gzip o zstd)"},
+                status_code=415,
+            )
+            return await response(scope, receive, send)
+
+        decoder = _RequestDecoder("zstd" if encoding == "zstd" else "gzip", self.max_bytes)
+        # el body que ve la app ya no está comprimido y su largo es desconocido
+        scope = dict(scope)
+        scope["headers"] = [
+            (k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")
+        ]
+
+        async def decoded_receive():
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            more_body = message.get("more_body", False)
+            body = decoder.decompress(message.get("body", b""), final=not more_body)
+            return {"type": "http.request", "body": body, "more_body": more_body}
+
+        await self.app(scope, decoded_receive, send)
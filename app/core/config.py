@@ -10,7 +10,9 @@ class Settings(BaseSettings):
     API_PREFIX: str = "/api/v1"
 
     API_KEY: str = "changeme"
-    
+    # keys adicionales, una por productor: cada una tiene su propio bucket de rate limit
+    # (en .env como JSON: API_KEYS=["key-a","key-b"])
+    API_KEYS: list[str] = []
 
     # MySQL
     MYSQL_HOST: str = "localhost"
@@ -21,8 +23,31 @@ class Settings(BaseSettings):
     MYSQL_CHARSET: str = "utf8mb4"
 
     DATA_DIR: str = "./app/data/inbox"
+
+    # Rate limiting por API key (rate <= 0 / concurrency <= 0 desactiva)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_HEADER: str = "X-API-Key"
+    RATE_LIMIT_MAX_KEYS: int = 10000
+    INGESTION_RATE_PER_SEC: float = 2.0
+    INGESTION_BURST: int = 5
+    INGESTION_MAX_CONCURRENCY: int = 2
+    METRICS_RATE_PER_SEC: float = 20.0
+    METRICS_BURST: int = 40
+    METRICS_MAX_CONCURRENCY: int = 8
+
+    # Compresión de respuestas (gzip/zstd según Accept-Encoding)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    # tope para bodies de petición con Content-Encoding (protege de zip bombs)
+    REQUEST_MAX_DECODED_BYTES: int = 512 * 1024 * 1024
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    @property
+    def api_keys(self) -> frozenset[str]:
+        return frozenset([self.API_KEY, *self.API_KEYS]) - {""}
     @property
     def data_path(self) -> Path: 
         return Path(self.DATA_DIR).expanduser().resolve()
@@ -0,0 +1,134 @@
+# app/core/ratelimit.py
+import math, threading, time
+from collections import OrderedDict
+from app.core.config import Settings
+from app.core.security import is_valid_api_key
+
+class KeyedLimiter:
+    """
+    Token bucket + límite de concurrencia por API key.
+
+    Estado por key: [tokens, último refill, peticiones en curso], en orden LRU.
+    Un único Lock protege operaciones cortas (sin I/O dentro), así que la
+    contención es mínima. Al llegar a max_keys solo se descartan keys ociosas
+    (sin peticiones en curso); si no hay ninguna, la petición se rechaza.
+    rate <= 0 o max_concurrency <= 0 desactivan la dimensión correspondiente.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int, max_keys: int = 10000, clock=time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(max(burst, 1))
+        self.max_concurrency = max_concurrency
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: OrderedDict[str, list] = OrderedDict()
+
+    def acquire(self, key: str) -> float | None:
+        """None si se admite la petición; si no, segundos sugeridos para Retry-After."""
+        now = self._clock()
+        with self._lock:
+            st = self._state.get(key)
+            if st is None:
+                if len(self._state) >= self.max_keys and not self._evict_idle():
+                    return 1.0
+                st = self._state[key] = [self.burst, now, 0]
+            else:
+                self._state.move_to_end(key)
+            if self.max_concurrency > 0 and st[2] >= self.max_concurrency:
+                return 1.0
+            if self.rate > 0:
+                st[0] = min(self.burst, st[0] + (now - st[1]) * self.rate)
+                st[1] = now
+                if st[0] < 1.0:
+                    return (1.0 - st[0]) / self.rate
+                st[0] -= 1.0
+            st[2] += 1
+            return None
+
+    def _evict_idle(self) -> bool:
+        """Descarta la key ociosa usada hace más tiempo. Llamar con el Lock tomado."""
+        for k, st in self._state.items():
+            if st[2] == 0:
+                del self._state[k]
+                return True
+        return False
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            st = self._state.get(key)
+            if st is not None and st[2] > 0:
+                st[2] -= 1
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI: decide antes de que FastAPI lea/parsee el body, así una
+    petición rechazada no consume multipart ni conexiones del pool de DB.
+    """
+
+    def __init__(self, app, settings: Settings):
+        self.app = app
+        self.settings = settings
+        self.header = settings.RATE_LIMIT_HEADER.lower().encode("latin-1")
+        ingestion = KeyedLimiter(
+            settings.INGESTION_RATE_PER_SEC, settings.INGESTION_BURST,
+            settings.INGESTION_MAX_CONCURRENCY, settings.RATE_LIMIT_MAX_KEYS)
+        # las lecturas (métricas y export de empleados) comparten la clase "metrics"
+        metrics = KeyedLimiter(
+            settings.METRICS_RATE_PER_SEC, settings.METRICS_BURST,
+            settings.METRICS_MAX_CONCURRENCY, settings.RATE_LIMIT_MAX_KEYS)
+        self.routes = [
+            (f"{settings.API_PREFIX}/ingestion", ingestion),
+            (f"{settings.API_PREFIX}/metrics", metrics),
+            (f"{settings.API_PREFIX}/employees", metrics),
+        ]
+
+    def _limiter_for(self, path: str) -> KeyedLimiter | None:
+        for prefix, limiter in self.routes:
+            if path.startswith(prefix):
+                return limiter
+        return None
+
+    def _key(self, scope) -> str:
+        """
+        Cada API key válida (API_KEY + API_KEYS, una por productor) tiene su
+        propio bucket. Todo el tráfico sin key válida comparte un único bucket
+        "anonymous": rotar keys inventadas o IPs no da capacidad extra, y
+        autenticarse nunca deja al cliente peor que no hacerlo.
+        """
+        for name, value in scope.get("headers", ()):
+            if name == self.header:
+                api_key = value.decode("latin-1")
+                if is_valid_api_key(api_key, self.settings):
+                    return f"key:{api_key}"
+                break
+        return "anonymous"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        limiter = self._limiter_for(scope["path"])
+        if limiter is None:
+            return await self.app(scope, receive, send)
+        key = self._key(scope)
+        retry_after = limiter.acquire(key)
+        if retry_after is not None:
+            return await self._reject(send, retry_after)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(key)
+
+    @staticmethod
+    async def _reject(send, retry_after: float):
+        body = b'{"detail":"Too many requests"}'
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -5,11 +5,14 @@ from app.core.config import get_settings, Settings
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+def is_valid_api_key(api_key: str | None, settings: Settings) -> bool:
+    return bool(api_key) and api_key in settings.api_keys
+
 def validate_api_key(
     api_key: str = Security(api_key_header),
     settings: Settings = Depends(get_settings),
 ):
-    if not api_key or api_key != settings.API_KEY:
+    if not is_valid_api_key(api_key, settings):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key",
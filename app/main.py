@@ -1,7 +1,9 @@
 # app/main.py
 from fastapi import FastAPI
 from app.core.config import get_settings
-from app.routers import system,ingestion,metrics
+from app.core.ratelimit import RateLimitMiddleware
+from app.core.compression import CompressionMiddleware, RequestDecompressionMiddleware
+from app.routers import system,ingestion,metrics,employees
 
 from fastapi.responses import RedirectResponse
 
@@ -9,6 +11,7 @@ tags_metadata = [
     {"name": "System", "description": "Salud del servicio y metadatos."},
     {"name": "Ingestion", "description": "Carga de CSV y batch (1–1000 filas)."},
     {"name": "Metrics", "description": "Consultas SQL 2021."},
+    {"name": "Employees", "description": "Lectura paginada (keyset) y export en streaming."},
 ]
 
 def create_app() -> FastAPI:
@@ -19,6 +22,11 @@ def create_app() -> FastAPI:
         description=settings.APP_DESCRIPTION,
         openapi_tags=tags_metadata,
     )
+    app.add_middleware(RequestDecompressionMiddleware, settings=settings)
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(RateLimitMiddleware, settings=settings)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware, settings=settings)
     
     # Redirige "/" -> "/docs"
     @app.get("/", include_in_schema=False)
@@ -27,6 +35,7 @@ def create_app() -> FastAPI:
     app.include_router(system.router, prefix=settings.API_PREFIX)
     app.include_router(ingestion.router, prefix=settings.API_PREFIX)
     app.include_router(metrics.router, prefix=settings.API_PREFIX)
+    app.include_router(employees.router, prefix=settings.API_PREFIX)
     for r in app.routes:
         try:
             print("ROUTE:", r.path, list(getattr(r, "methods", [])))
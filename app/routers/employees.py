@@ -0,0 +1,139 @@
+# app/routers/employees.py
+from datetime import date
+from decimal import Decimal
+from typing import Literal
+import csv, io, json
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+from app.db import get_db, engine
+from app.models import Department, Job, Employee
+from app.schemas import EmployeePage
+
+router = APIRouter()
+MAX_PAGE = 1000
+EXPORT_CHUNK = 5000
+
+EXPORT_COLUMNS = [
+    "id", "first_name", "last_name", "hire_date", "salary",
+    "department_id", "department", "job_id", "job",
+]
+
+# -------- consulta base --------
+def _employees_query(
+    hire_date_from: date | None,
+    hire_date_to: date | None,
+    department_id: int | None,
+    job_id: int | None,
+) -> Select:
+    """
+    SELECT de columnas (no entidades ORM) con LEFT JOIN a departments/jobs:
+    los nombres llegan en la misma fila, sin lazy loads de Employee.department/job.
+    Los filtros son rangos/igualdades sobre columnas indexadas (hire_date,
+    department_id, job_id) para que MySQL pueda usar los índices existentes.
+    """
+    if hire_date_from and hire_date_to and hire_date_from > hire_date_to:
+        raise HTTPException(status_code=422, detail="hire_date_from debe ser <= hire_date_to")
+    stmt = (
+        select(
+            Employee.id,
+            Employee.first_name,
+            Employee.last_name,
+            Employee.hire_date,
+            Employee.salary,
+            Employee.department_id,
+            Department.name.label("department"),
+            Employee.job_id,
+            Job.title.label("job"),
+        )
+        .outerjoin(Department, Department.id == Employee.department_id)
+        .outerjoin(Job, Job.id == Employee.job_id)
+    )
+    if hire_date_from is not None:
+        stmt = stmt.where(Employee.hire_date >= hire_date_from)
+    if hire_date_to is not None:
+        stmt = stmt.where(Employee.hire_date <= hire_date_to)
+    if department_id is not None:
+        stmt = stmt.where(Employee.department_id == department_id)
+    if job_id is not None:
+        stmt = stmt.where(Employee.job_id == job_id)
+    return stmt.order_by(Employee.id.asc())
+
+# -------- serialización del export --------
+def _json_default(v):
+    # DECIMAL(18,2) como string exacto, igual que en el CSV (float perdería precisión)
+    if isinstance(v, Decimal):
+        return str(v)
+    if isinstance(v, date):
+        return v.isoformat()
+    raise TypeError(f"No serializable: {type(v)!r}")
+
+def _csv_chunk(rows, header: bool = False) -> str:
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator="\n")
+    if header:
+        w.writerow(EXPORT_COLUMNS)
+    w.writerows(tuple(r) for r in rows)
+    return buf.getvalue()
+
+def _ndjson_chunk(rows) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, r)), default=_json_default, ensure_ascii=False) + "\n"
+        for r in rows
+    )
+
+def _stream_export(stmt: Select, fmt: str):
+    """
+    Itera con cursor del lado del servidor (stream_results -> SSCursor en PyMySQL)
+    en particiones de EXPORT_CHUNK filas: la memoria no depende del tamaño de la tabla.
+    Usa su propia conexión porque la sesión de get_db se cierra antes de que
+    termine de enviarse el StreamingResponse.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=EXPORT_CHUNK).execute(stmt)
+        if fmt == "csv":
+            yield _csv_chunk((), header=True)
+        for rows in result.partitions():
+            yield _csv_chunk(rows) if fmt == "csv" else _ndjson_chunk(rows)
+
+# -------- endpoints --------
+@router.get("/employees", tags=["Employees"], summary="Listar empleados (paginación keyset por id)",
+            response_model=EmployeePage)
+def list_employees(
+    after_id: int | None = Query(None, ge=0, description="Último id de la página anterior"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE),
+    hire_date_from: date | None = None,
+    hire_date_to: date | None = None,
+    department_id: int | None = None,
+    job_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    stmt = _employees_query(hire_date_from, hire_date_to, department_id, job_id)
+    if after_id is not None:
+        stmt = stmt.where(Employee.id > after_id)
+    # se pide una fila extra para saber si hay página siguiente sin COUNT(*)
+    rows = db.execute(stmt.limit(limit + 1)).mappings().all()
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    return {
+        "items": items,
+        "limit": limit,
+        "next_after_id": items[-1]["id"] if has_more else None,
+    }
+
+@router.get("/employees/export", tags=["Employees"], summary="Exportar empleados en streaming (CSV/NDJSON)")
+def export_employees(
+    format: Literal["csv", "ndjson"] = "csv",
+    hire_date_from: date | None = None,
+    hire_date_to: date | None = None,
+    department_id: int | None = None,
+    job_id: int | None = None,
+):
+    stmt = _employees_query(hire_date_from, hire_date_to, department_id, job_id)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream_export(stmt, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="employees.{format}"'},
+    )
@@ -3,10 +3,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 from io import BytesIO
 import pandas as pd
+import zstandard
 from pathlib import Path
 from datetime import datetime
-from typing import Tuple,Optional
-import logging, uuid, io
+from typing import BinaryIO, Tuple, Optional
+import gzip, io, logging, uuid, zlib
 from app.db import get_db
 from app.models import Department, Job, Employee
 from app.core.config import get_settings
@@ -23,25 +24,109 @@ READ_CSV_KW = dict(
     na_values=["", " ", "NA", "NaN", "nan", "NULL", "Null", "None", "none"],
 )
 
+# -------- entradas comprimidas (.gz / .zst) --------
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_DECOMPRESS_ERRORS = (gzip.BadGzipFile, EOFError, zlib.error, zstandard.ZstdError)
+
+class _ZstdReader(io.RawIOBase):
+    """
+    Lector zstd incremental que, a diferencia de stream_reader, falla si la
+    entrada termina a mitad de un frame (archivo truncado). Admite frames concatenados.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._dobj = zstandard.ZstdDecompressor().decompressobj()
+        self._buf = memoryview(b"")
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _feed(self, data: bytes) -> bytes:
+        out = []
+        while data:
+            if self._dobj.eof:
+                self._dobj = zstandard.ZstdDecompressor().decompressobj()
+            out.append(self._dobj.decompress(data))
+            data = self._dobj.unused_data if self._dobj.eof else b""
+        return b"".join(out)
+
+    def readinto(self, b) -> int:
+        while not self._buf and not self._done:
+            chunk = self._raw.read(1 << 16)
+            if not chunk:
+                if not self._dobj.eof:
+                    raise zstandard.ZstdError("frame zstd incompleto (entrada truncada)")
+                self._done = True
+                break
+            self._buf = memoryview(self._feed(chunk))
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+def _detect_compression(raw: BinaryIO, declared: str | None = None) -> str | None:
+    """
+    Detecta gzip/zstd por magic bytes (la extensión puede mentir). Si el cliente
+    declara Content-Encoding y no coincide con el contenido, se rechaza.
+    """
+    head = raw.read(4)
+    raw.seek(0)
+    kind = "gzip" if head.startswith(GZIP_MAGIC) else "zstd" if head.startswith(ZSTD_MAGIC) else None
+    declared = (declared or "").strip().lower()
+    if declared in ("gzip", "x-gzip", "zstd") and declared.replace("x-", "") != kind:
+        raise HTTPException(status_code=422, detail=f"Content-Encoding '{declared}' no coincide con el contenido")
+    return kind
+
+def _decompress_stream(raw: BinaryIO, kind: str | None) -> BinaryIO:
+    """Envuelve raw en un lector que descomprime al vuelo; no carga el archivo entero."""
+    if kind == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if kind == "zstd":
+        return io.BufferedReader(_ZstdReader(raw), buffer_size=1 << 16)
+    return raw
+
+def _count_rows(f: BinaryIO) -> int:
+    """Cuenta líneas de datos (sin header) leyendo en bloques de 1 MiB."""
+    lines, last = 0, b"\n"
+    while chunk := f.read(1 << 20):
+        lines += chunk.count(b"\n")
+        last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    return max(lines - 1, 0)
+
+def _read_csv_stream(raw: BinaryIO, offset: int = 0, limit: int | None = None, declared: str | None = None):
+    kind = _detect_compression(raw, declared)
+    try:
+        f = _decompress_stream(raw, kind)
+        if limit is not None:
+            df = pd.read_csv(f, skiprows=range(1, offset + 1), nrows=limit, **READ_CSV_KW)
+        else:
+            df = pd.read_csv(f, **READ_CSV_KW)
+        raw.seek(0)
+        total = _count_rows(_decompress_stream(raw, kind))
+    except _DECOMPRESS_ERRORS as e:
+        if kind is None:  # errores de I/O sobre un CSV plano no son de descompresión
+            raise
+        raise HTTPException(status_code=422, detail=f"No se pudo descomprimir el CSV ({kind}): {e}")
+    except pd.errors.EmptyDataError:
+        raise HTTPException(status_code=422, detail="El CSV está vacío")
+    return df, total
+
 def _read_csv_path(filename: str, offset: int = 0, limit: int | None = None):
     settings = get_settings()
     path = (settings.data_path / filename).resolve()
     if not path.exists():
         raise HTTPException(status_code=404, detail=f"No existe {path}")
-    if limit is not None:
-        df = pd.read_csv(path, skiprows=range(1, offset + 1), nrows=limit, **READ_CSV_KW)
-    else:
-        df = pd.read_csv(path, **READ_CSV_KW)
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        total = max(sum(1 for _ in f) - 1, 0)
-    return df, total
+    with path.open("rb") as raw:
+        return _read_csv_stream(raw, offset=offset, limit=limit)
 
 def _read_csv_upload(file: UploadFile, offset: int = 0, limit: int | None = None):
-    raw = file.file.read()
-    df_full = pd.read_csv(io.BytesIO(raw), **READ_CSV_KW)
-    total = len(df_full)
-    df = df_full.iloc[offset: offset + limit if limit is not None else None]
-    return df, total
+    declared = file.headers.get("content-encoding") if file.headers else None
+    return _read_csv_stream(file.file, offset=offset, limit=limit, declared=declared)
 # --- helpers de normalización/parseo ---
 def _normalize_name(s: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -116,12 +201,12 @@ def _ingest_departments(df: pd.DataFrame, db: Session) -> dict:
 
 @router.post("/ingestion/departments/csv", tags=["Ingestion"], summary="Subir departments.csv (multipart)")
 def ingest_departments_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    df = _read_csv_upload(file)
+    df, _ = _read_csv_upload(file)
     return _ingest_departments(df, db)
 
 @router.post("/ingestion/departments/file/{filename}", tags=["Ingestion"], summary="Leer departments.csv desde DATA_DIR")
 def ingest_departments_file(filename: str, db: Session = Depends(get_db)):
-    df = _read_csv_path(filename)
+    df, _ = _read_csv_path(filename)
     return _ingest_departments(df, db)
 
 # -------- jobs.csv --------
@@ -147,12 +232,12 @@ def _ingest_jobs(df: pd.DataFrame, db: Session) -> dict:
 
 @router.post("/ingestion/jobs/csv", tags=["Ingestion"], summary="Subir jobs.csv (multipart)")
 def ingest_jobs_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    df = _read_csv_upload(file)
+    df, _ = _read_csv_upload(file)
     return _ingest_jobs(df, db)
 
 @router.post("/ingestion/jobs/file/{filename}", tags=["Ingestion"], summary="Leer jobs.csv desde DATA_DIR")
 def ingest_jobs_file(filename: str, db: Session = Depends(get_db)):
-    df = _read_csv_path(filename)
+    df, _ = _read_csv_path(filename)
     return _ingest_jobs(df, db)
 @router.get("/ingestion/ping", tags=["Ingestion"], summary="Ping de ingesta")
 def ingestion_ping():
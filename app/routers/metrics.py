@@ -1,15 +1,83 @@
 # app/routers/metrics.py
+from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.db import get_db
 
 router = APIRouter()
+MAX_YEARS = 50
+
+# -------- rango de periodos y filtros --------
+def _resolve_range(
+    year: int | None,
+    year_from: int | None,
+    year_to: int | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> tuple[date, date]:
+    """
+    Devuelve [start, end) sobre hire_date a partir de uno de: date_from/date_to,
+    year_from/year_to o year (por defecto 2021). Mezclar estilos es un 422.
+    El rango semiabierto permite usar ix_employees_hire_date (sin YEAR() en el WHERE).
+    """
+    styles = [
+        year is not None,
+        year_from is not None or year_to is not None,
+        date_from is not None or date_to is not None,
+    ]
+    if sum(styles) > 1:
+        raise HTTPException(status_code=422,
+                            detail="Usar solo uno de: year, year_from/year_to o date_from/date_to")
+    for d in (date_from, date_to):
+        if d is not None and not 1900 <= d.year <= 2100:
+            raise HTTPException(status_code=422, detail="Las fechas deben estar entre 1900 y 2100")
+    if date_from is not None or date_to is not None:
+        # si falta un extremo, se completa con el borde del año del otro
+        start = date_from or date(date_to.year, 1, 1)
+        end = (date_to or date(date_from.year, 12, 31)) + timedelta(days=1)
+    elif year_from is not None or year_to is not None:
+        start = date(year_from or year_to, 1, 1)
+        end = date((year_to or year_from) + 1, 1, 1)
+    else:
+        y = year if year is not None else 2021
+        start, end = date(y, 1, 1), date(y + 1, 1, 1)
+    if start >= end:
+        raise HTTPException(status_code=422, detail="El inicio del rango debe ser <= al fin")
+    if (end - timedelta(days=1)).year - start.year + 1 > MAX_YEARS:
+        raise HTTPException(status_code=422, detail=f"El rango no puede abarcar más de {MAX_YEARS} años")
+    return start, end
+
+def _periods(start: date, end: date) -> list[int]:
+    return list(range(start.year, (end - timedelta(days=1)).year + 1))
+
+def _filters(alias: str, department_id: int | None, job_id: int | None) -> tuple[str, dict]:
+    where = f"{alias}hire_date >= :start AND {alias}hire_date < :end"
+    params: dict = {}
+    if department_id is not None:
+        where += f" AND {alias}department_id = :department_id"
+        params["department_id"] = department_id
+    if job_id is not None:
+        where += f" AND {alias}job_id = :job_id"
+        params["job_id"] = job_id
+    return where, params
 
 @router.get("/metrics/hired-per-quarter")
-def hired_per_quarter(year: int = Query(2021, ge=1900, le=2100), db: Session = Depends(get_db)):
-    sql = text("""
-        SELECT d.name AS department, j.title AS job,
+def hired_per_quarter(
+    year: int | None = Query(None, ge=1900, le=2100),
+    year_from: int | None = Query(None, ge=1900, le=2100),
+    year_to: int | None = Query(None, ge=1900, le=2100),
+    date_from: date | None = None,
+    date_to: date | None = None,
+    department_id: int | None = None,
+    job_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    start, end = _resolve_range(year, year_from, year_to, date_from, date_to)
+    where, params = _filters("e.", department_id, job_id)
+    # una sola pasada: todos los años del rango agrupados por (year, department, job)
+    sql = text(f"""
+        SELECT YEAR(e.hire_date) AS year, d.name AS department, j.title AS job,
                 SUM(CASE WHEN QUARTER(e.hire_date)=1 THEN 1 ELSE 0 END) AS Q1,
                 SUM(CASE WHEN QUARTER(e.hire_date)=2 THEN 1 ELSE 0 END) AS Q2,
                 SUM(CASE WHEN QUARTER(e.hire_date)=3 THEN 1 ELSE 0 END) AS Q3,
@@ -17,31 +85,54 @@ def hired_per_quarter(year: int = Query(2021, ge=1900, le=2100), db: Session = D
         FROM employees e
         JOIN departments d ON d.id = e.department_id
         JOIN jobs        j ON j.id = e.job_id
-        WHERE YEAR(e.hire_date) = :year
-        GROUP BY d.name, j.title
-        ORDER BY d.name ASC, j.title ASC
+        WHERE {where}
+        GROUP BY YEAR(e.hire_date), d.name, j.title
+        ORDER BY year ASC, d.name ASC, j.title ASC
     """)
-    rows = db.execute(sql, {"year": year}).mappings().all()
-    return rows
+    rows = db.execute(sql, {"start": start, "end": end, **params}).mappings().all()
+    out: dict[str, list] = {str(y): [] for y in _periods(start, end)}
+    for r in rows:
+        out[str(r["year"])].append({k: r[k] for k in ("department", "job", "Q1", "Q2", "Q3", "Q4")})
+    return out
 
 @router.get("/metrics/departments-above-mean")
-def departments_above_mean(year: int = Query(2021, ge=1900, le=2100), db: Session = Depends(get_db)):
-    sql = text("""
+def departments_above_mean(
+    year: int | None = Query(None, ge=1900, le=2100),
+    year_from: int | None = Query(None, ge=1900, le=2100),
+    year_to: int | None = Query(None, ge=1900, le=2100),
+    date_from: date | None = None,
+    date_to: date | None = None,
+    department_id: int | None = None,
+    job_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    start, end = _resolve_range(year, year_from, year_to, date_from, date_to)
+    # la media se calcula por año sobre todos los departamentos; department_id
+    # solo filtra el resultado (dentro del CTE la media sería su propio valor)
+    where, params = _filters("", None, job_id)
+    outer = ""
+    if department_id is not None:
+        outer = " AND h.department_id = :department_id"
+        params["department_id"] = department_id
+    sql = text(f"""
         WITH hires AS (
-            SELECT department_id, COUNT(*) AS hired
+            SELECT YEAR(hire_date) AS year, department_id, COUNT(*) AS hired
             FROM employees
-            WHERE YEAR(hire_date) = :year
-            GROUP BY department_id
+            WHERE {where}
+            GROUP BY YEAR(hire_date), department_id
         ),
         meanval AS (
-            SELECT AVG(hired) AS avg_hired FROM hires
+            SELECT year, AVG(hired) AS avg_hired FROM hires GROUP BY year
         )
-        SELECT d.id, d.name AS department, h.hired
+        SELECT h.year, d.id, d.name AS department, h.hired
         FROM hires h
         JOIN departments d ON d.id = h.department_id
-        JOIN meanval m
-        WHERE h.hired > m.avg_hired
-        ORDER BY h.hired DESC
+        JOIN meanval m ON m.year = h.year
+        WHERE h.hired > m.avg_hired{outer}
+        ORDER BY h.year ASC, h.hired DESC
     """)
-    rows = db.execute(sql, {"year": year}).mappings().all()
-    return rows
+    rows = db.execute(sql, {"start": start, "end": end, **params}).mappings().all()
+    out: dict[str, list] = {str(y): [] for y in _periods(start, end)}
+    for r in rows:
+        out[str(r["year"])].append({"id": r["id"], "department": r["department"], "hired": r["hired"]})
+    return out
@@ -15,3 +15,19 @@ class EmployeeIn(BaseModel):
         if v is not None and v < 0:
             raise ValueError("salary must be >= 0")
         return v
+
+class EmployeeOut(BaseModel):
+    id:            int
+    first_name:    str
+    last_name:     str
+    hire_date:     date
+    salary:        float | None = None
+    department_id: int | None = None
+    department:    str | None = None
+    job_id:        int | None = None
+    job:           str | None = None
+
+class EmployeePage(BaseModel):
+    items:         list[EmployeeOut]
+    limit:         int
+    next_after_id: int | None = None
@@ -0,0 +1,70 @@
+# benchmarks/bench_compression.py
+"""
+Compara CSV plano vs .gz vs .zst en la ingesta de hired_employees
+(bytes subidos y tiempo end-to-end) y el tamaño de /employees/export
+con y sin compresión de respuesta.
+
+Uso (con la API levantada y departments/jobs cargados):
+    python benchmarks/bench_compression.py --base-url http://localhost:8000/api/v1 --rows 10000
+"""
+import argparse, gzip, io, random, statistics, time
+from datetime import date, timedelta
+import httpx
+import zstandard
+
+def _synthetic_csv(rows: int, departments: int, jobs: int) -> bytes:
+    rnd = random.Random(42)
+    buf = io.StringIO()
+    buf.write("id,name,datetime,department_id,job_id\n")
+    base = date(2017, 1, 1)
+    for i in range(1, rows + 1):
+        d = base + timedelta(days=rnd.randrange(5 * 365))
+        buf.write(f"{900000 + i},Bench User{i},{d.isoformat()}T08:00:00Z,"
+                  f"{rnd.randint(1, departments)},{rnd.randint(1, jobs)}\n")
+    return buf.getvalue().encode()
+
+def _post(client: httpx.Client, name: str, payload: bytes, rows: int) -> float:
+    while True:
+        t0 = time.perf_counter()
+        r = client.post("/ingestion/hired/csv", params={"limit": rows},
+                        files={"file": (name, payload, "application/octet-stream")})
+        if r.status_code == 429:
+            time.sleep(float(r.headers.get("Retry-After", "1")))
+            continue
+        r.raise_for_status()
+        return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    ap.add_argument("--rows", type=int, default=10000)
+    ap.add_argument("--departments", type=int, default=12)
+    ap.add_argument("--jobs", type=int, default=183)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--api-key", default="changeme")
+    args = ap.parse_args()
+
+    raw = _synthetic_csv(args.rows, args.departments, args.jobs)
+    inputs = [
+        ("hired.csv", raw),
+        ("hired.csv.gz", gzip.compress(raw)),
+        ("hired.csv.zst", zstandard.ZstdCompressor(level=3).compress(raw)),
+    ]
+
+    with httpx.Client(base_url=args.base_url, timeout=300, headers={"X-API-Key": args.api_key}) as client:
+        print(f"Ingesta de {args.rows} filas")
+        for name, payload in inputs:
+            times = [_post(client, name, payload, args.rows) for _ in range(args.repeat)]
+            print(f"  {name:16s} {len(payload):>10,d} bytes  mediana {statistics.median(times) * 1000:8.1f} ms")
+
+        print("Export /employees/export?format=csv")
+        for enc in ("identity", "gzip", "zstd"):
+            t0 = time.perf_counter()
+            with client.stream("GET", "/employees/export", params={"format": "csv"},
+                               headers={"Accept-Encoding": enc}) as r:
+                wire = sum(len(c) for c in r.iter_raw())
+                served = r.headers.get("content-encoding", "identity")
+            print(f"  {enc:8s} -> {served:8s} {wire:>12,d} bytes  {(time.perf_counter() - t0) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_metrics.py
+"""
+Compara una petición por rango (year_from..year_to) contra N peticiones de un año.
+
+Uso (con la API levantada y datos cargados):
+    python benchmarks/bench_metrics.py --base-url http://localhost:8000/api/v1 --from 2017 --to 2021
+
+Las peticiones rechazadas con 429 se reintentan tras Retry-After y el tiempo
+de espera queda fuera de la medición; para evitar las esperas, levantar la
+API con RATE_LIMIT_ENABLED=false.
+"""
+import argparse, statistics, time
+import httpx
+
+ENDPOINTS = ["/metrics/hired-per-quarter", "/metrics/departments-above-mean"]
+
+def _get(client: httpx.Client, ep: str, params: dict) -> float:
+    """Devuelve la duración del intento exitoso; las esperas por 429 no cuentan."""
+    while True:
+        t0 = time.perf_counter()
+        r = client.get(ep, params=params)
+        if r.status_code == 429:
+            time.sleep(float(r.headers.get("Retry-After", "1")))
+            continue
+        r.raise_for_status()
+        return time.perf_counter() - t0
+
+def _timed(fn, repeat: int) -> list[float]:
+    return [fn() for _ in range(repeat)]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    ap.add_argument("--from", dest="year_from", type=int, default=2017)
+    ap.add_argument("--to", dest="year_to", type=int, default=2021)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--api-key", default="changeme")
+    args = ap.parse_args()
+    years = range(args.year_from, args.year_to + 1)
+
+    with httpx.Client(base_url=args.base_url, timeout=60, headers={"X-API-Key": args.api_key}) as client:
+        for ep in ENDPOINTS:
+            def ranged() -> float:
+                return _get(client, ep, {"year_from": args.year_from, "year_to": args.year_to})
+
+            def per_year() -> float:
+                return sum(_get(client, ep, {"year": y}) for y in years)
+
+            ranged()  # warm-up
+            t_range = _timed(ranged, args.repeat)
+            t_years = _timed(per_year, args.repeat)
+            med_r, med_y = statistics.median(t_range), statistics.median(t_years)
+            print(f"{ep}")
+            print(f"  1 petición {args.year_from}-{args.year_to}: mediana {med_r * 1000:8.2f} ms")
+            print(f"  {len(years)} peticiones por año:      mediana {med_y * 1000:8.2f} ms")
+            print(f"  speedup: {med_y / med_r:.2f}x")
+
+if __name__ == "__main__":
+    main()
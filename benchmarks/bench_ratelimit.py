@@ -0,0 +1,44 @@
+# benchmarks/bench_ratelimit.py
+"""
+Mide el overhead por petición del limitador (acquire + release), en un hilo
+y con varios hilos compitiendo por el mismo Lock. No necesita DB.
+
+Uso:
+    python benchmarks/bench_ratelimit.py --n 200000 --threads 8
+"""
+import argparse, sys, threading, time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from app.core.ratelimit import KeyedLimiter
+
+def _run(lim: KeyedLimiter, key: str, n: int):
+    for _ in range(n):
+        if lim.acquire(key) is None:
+            lim.release(key)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200000)
+    ap.add_argument("--threads", type=int, default=8)
+    ap.add_argument("--keys", type=int, default=100)
+    args = ap.parse_args()
+    lim = KeyedLimiter(rate=1e9, burst=10**9, max_concurrency=10**6)
+
+    t0 = time.perf_counter()
+    _run(lim, "single", args.n)
+    dt = time.perf_counter() - t0
+    print(f"1 hilo:        {dt / args.n * 1e6:.3f} µs/petición")
+
+    per = args.n // args.threads
+    ths = [threading.Thread(target=_run, args=(lim, f"k{i % args.keys}", per)) for i in range(args.threads)]
+    t0 = time.perf_counter()
+    for t in ths:
+        t.start()
+    for t in ths:
+        t.join()
+    dt = time.perf_counter() - t0
+    print(f"{args.threads} hilos:       {dt / (per * args.threads) * 1e6:.3f} µs/petición (throughput agregado)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+# tests/conftest.py
+import os
+
+# la app compartida por los tests no aplica rate limit: todos los TestClient
+# salen de la misma IP y agotarían el burst al crecer la suite.
+# tests/test_ratelimit.py monta su propio middleware con Settings explícitos.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
@@ -0,0 +1,162 @@
+# tests/test_compression.py
+import gzip, io
+import pytest
+import zstandard
+from fastapi import HTTPException
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.main import app
+from app.db import Base, get_db
+from app.core.config import Settings
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.routers.ingestion import _read_csv_stream
+
+CSV = b"id,name,datetime,department_id,job_id\n1,Ana Perez,2021-03-01T00:00:00Z,1,1\n2,Luis Diaz,2021-07-01T00:00:00Z,2,2\n"
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate, br, zstd") == "zstd"
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("zstd;q=0, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("identity") is None
+
+def test_read_csv_stream_plain_and_gzip_match():
+    df_raw, total_raw = _read_csv_stream(io.BytesIO(CSV))
+    df_gz, total_gz = _read_csv_stream(io.BytesIO(gzip.compress(CSV)), declared="gzip")
+    assert total_raw == total_gz == 2
+    assert df_raw.equals(df_gz)
+
+def test_read_csv_stream_offset_limit_on_gzip():
+    df, total = _read_csv_stream(io.BytesIO(gzip.compress(CSV)), offset=1, limit=1)
+    assert total == 2
+    assert df["id"].tolist() == ["2"]
+
+def test_read_csv_stream_zstd_matches_plain():
+    df_raw, total_raw = _read_csv_stream(io.BytesIO(CSV))
+    df_zst, total_zst = _read_csv_stream(io.BytesIO(zstandard.ZstdCompressor().compress(CSV)), declared="zstd")
+    assert total_zst == total_raw == 2
+    assert df_raw.equals(df_zst)
+
+def _big_csv(rows: int = 20000) -> bytes:
+    return CSV.splitlines(keepends=True)[0] + b"".join(
+        f"{i},Ana Perez,2021-03-01T00:00:00Z,1,1\n".encode() for i in range(rows))
+
+@pytest.mark.parametrize("cut", [0.5, 0.01])
+def test_truncated_zstd_is_rejected(cut):
+    payload = zstandard.ZstdCompressor().compress(_big_csv())
+    with pytest.raises(HTTPException) as exc:
+        _read_csv_stream(io.BytesIO(payload[: int(len(payload) * cut)]))
+    assert exc.value.status_code == 422
+
+def test_corrupt_gzip_is_rejected():
+    payload = bytearray(gzip.compress(_big_csv()))
+    payload[20:60] = bytes(b ^ 0xFF for b in payload[20:60])
+    with pytest.raises(HTTPException) as exc:
+        _read_csv_stream(io.BytesIO(bytes(payload)))
+    assert exc.value.status_code == 422
+
+def test_empty_zstd_frame_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        _read_csv_stream(io.BytesIO(zstandard.ZstdCompressor().compress(b"")))
+    assert exc.value.status_code == 422
+
+def test_io_errors_on_plain_csv_are_not_reported_as_decompression():
+    class Failing(io.BytesIO):
+        def read(self, *args):
+            if self.tell() > 0:
+                raise OSError("disk error")
+            return super().read(*args)
+
+    with pytest.raises(OSError):
+        _read_csv_stream(Failing(CSV))
+
+def test_declared_encoding_mismatch_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        _read_csv_stream(io.BytesIO(CSV), declared="gzip")
+    assert exc.value.status_code == 422
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse("x" * 5000)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    app.add_middleware(CompressionMiddleware, settings=Settings(COMPRESSION_MIN_SIZE=1024))
+    return TestClient(app)
+
+def test_large_response_is_gzipped():
+    r = _app().get("/big", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in r.headers["vary"]
+    assert r.text == "x" * 5000
+
+def test_small_response_is_not_compressed():
+    r = _app().get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.text == "ok"
+
+def test_large_response_is_zstd_when_accepted():
+    r = _app().get("/big", headers={"Accept-Encoding": "zstd, gzip"})
+    assert r.headers["content-encoding"] == "zstd"
+    assert r.text == "x" * 5000  # httpx decodifica zstd con zstandard instalado
+
+# -------- Content-Encoding a nivel de petición --------
+@pytest.fixture
+def api_client():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def override():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+def _multipart(csv: bytes) -> tuple[bytes, str]:
+    boundary = "testboundary"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="departments.csv"\r\n'
+        "Content-Type: text/csv\r\n\r\n"
+    ).encode() + csv + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+DEPARTMENTS = b"id,department\n1,Sales\n2,Ops\n"
+
+@pytest.mark.parametrize("encoding,compress", [
+    ("gzip", gzip.compress),
+    ("zstd", lambda b: zstandard.ZstdCompressor().compress(b)),
+])
+def test_request_level_content_encoding_is_decoded(api_client, encoding, compress):
+    body, ctype = _multipart(DEPARTMENTS)
+    r = api_client.post("/api/v1/ingestion/departments/csv", content=compress(body),
+                        headers={"Content-Type": ctype, "Content-Encoding": encoding})
+    assert r.status_code == 200, r.text
+    assert r.json()["created"] == 2
+
+def test_request_level_unsupported_encoding_is_415(api_client):
+    body, ctype = _multipart(DEPARTMENTS)
+    r = api_client.post("/api/v1/ingestion/departments/csv", content=body,
+                        headers={"Content-Type": ctype, "Content-Encoding": "br"})
+    assert r.status_code == 415
+
+def test_request_level_truncated_body_is_rejected(api_client):
+    body, ctype = _multipart(DEPARTMENTS * 200)
+    payload = gzip.compress(body)
+    r = api_client.post("/api/v1/ingestion/departments/csv", content=payload[: len(payload) // 2],
+                        headers={"Content-Type": ctype, "Content-Encoding": "gzip"})
+    assert r.status_code == 400
@@ -0,0 +1,105 @@
+# tests/test_employees.py
+import json
+from datetime import date
+from decimal import Decimal
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.main import app
+from app.db import Base, get_db
+from app.models import Department, Job, Employee
+from app.routers import employees as employees_router
+from app.routers.employees import _csv_chunk, _ndjson_chunk
+
+client = TestClient(app)
+
+@pytest.fixture
+def sqlite_db(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    with Session() as db:
+        db.add_all([Department(id=1, name="Sales"), Department(id=2, name="Ops"), Job(id=1, title="Analyst")])
+        db.add_all([
+            Employee(id=i, first_name=f"N{i}", last_name="L", hire_date=date(2021, i, 1),
+                     department_id=1 if i % 2 else 2, job_id=1)
+            for i in range(1, 6)
+        ])
+        db.add(Employee(id=6, first_name="Sin", last_name="Depto", hire_date=date(2022, 1, 1)))
+        db.commit()
+
+    def override():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override
+    monkeypatch.setattr(employees_router, "engine", engine)
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+def test_list_employees_rejects_limit_out_of_range():
+    r = client.get("/api/v1/employees", params={"limit": 0})
+    assert r.status_code == 422
+    r = client.get("/api/v1/employees", params={"limit": 1001})
+    assert r.status_code == 422
+
+def test_export_rejects_unknown_format():
+    r = client.get("/api/v1/employees/export", params={"format": "xml"})
+    assert r.status_code == 422
+
+def test_export_rejects_inverted_date_range():
+    r = client.get("/api/v1/employees/export",
+                   params={"hire_date_from": "2022-01-01", "hire_date_to": "2021-01-01"})
+    assert r.status_code == 422
+
+def test_csv_chunk_header_nulls_and_types():
+    row = (1, "Ana", "Perez", date(2021, 3, 1), Decimal("10.50"), None, None, 2, "Analyst")
+    out = _csv_chunk([row], header=True).splitlines()
+    assert out[0] == "id,first_name,last_name,hire_date,salary,department_id,department,job_id,job"
+    assert out[1] == "1,Ana,Perez,2021-03-01,10.50,,,2,Analyst"
+    assert _csv_chunk([row]).count("\n") == 1
+
+def test_ndjson_chunk_nulls_and_types():
+    row = (1, "Ana", "Perez", date(2021, 3, 1), Decimal("10.50"), None, None, 2, "Analyst")
+    rec = json.loads(_ndjson_chunk([row]))
+    assert rec["hire_date"] == "2021-03-01"
+    assert rec["salary"] == "10.50"
+    big = json.loads(_ndjson_chunk([row[:4] + (Decimal("9999999999999999.99"),) + row[5:]]))
+    assert big["salary"] == "9999999999999999.99"
+    assert rec["department"] is None and rec["department_id"] is None
+
+def test_keyset_paging_walks_all_rows(sqlite_db):
+    ids, after = [], None
+    while True:
+        params = {"limit": 2, **({"after_id": after} if after is not None else {})}
+        page = client.get("/api/v1/employees", params=params).json()
+        ids += [e["id"] for e in page["items"]]
+        after = page["next_after_id"]
+        if after is None:
+            break
+    assert ids == [1, 2, 3, 4, 5, 6]
+
+def test_list_filters_and_joined_names(sqlite_db):
+    page = client.get("/api/v1/employees", params={
+        "department_id": 1, "hire_date_from": "2021-02-01", "hire_date_to": "2021-12-31",
+    }).json()
+    assert [e["id"] for e in page["items"]] == [3, 5]
+    assert {e["department"] for e in page["items"]} == {"Sales"}
+    assert page["next_after_id"] is None
+
+def test_export_csv_and_ndjson(sqlite_db):
+    r = client.get("/api/v1/employees/export", params={"format": "csv"})
+    assert r.status_code == 200
+    lines = r.text.splitlines()
+    assert lines[0].startswith("id,first_name")
+    assert len(lines) == 7
+    assert lines[-1] == "6,Sin,Depto,2022-01-01,,,,,"
+    r = client.get("/api/v1/employees/export", params={"format": "ndjson", "job_id": 1})
+    recs = [json.loads(l) for l in r.text.splitlines()]
+    assert [x["id"] for x in recs] == [1, 2, 3, 4, 5]
+    assert recs[0]["job"] == "Analyst"
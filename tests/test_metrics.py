@@ -0,0 +1,101 @@
+# tests/test_metrics.py
+from datetime import date
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.main import app
+from app.db import Base, get_db
+from app.models import Department, Job, Employee
+from app.routers.metrics import _resolve_range, _periods
+
+def test_resolve_range_defaults_to_2021():
+    assert _resolve_range(None, None, None, None, None) == (date(2021, 1, 1), date(2022, 1, 1))
+
+def test_resolve_range_years():
+    start, end = _resolve_range(None, 2017, 2021, None, None)
+    assert (start, end) == (date(2017, 1, 1), date(2022, 1, 1))
+    assert _periods(start, end) == [2017, 2018, 2019, 2020, 2021]
+
+def test_resolve_range_dates_are_inclusive():
+    start, end = _resolve_range(None, None, None, date(2020, 3, 1), date(2021, 6, 30))
+    assert (start, end) == (date(2020, 3, 1), date(2021, 7, 1))
+    assert _periods(start, end) == [2020, 2021]
+
+def test_resolve_range_rejects_inverted_range():
+    with pytest.raises(HTTPException) as exc:
+        _resolve_range(None, 2022, 2021, None, None)
+    assert exc.value.status_code == 422
+
+@pytest.mark.parametrize("kwargs", [
+    {"year": 2021, "year_from": 2020},
+    {"year": 2021, "date_from": date(2021, 1, 1)},
+    {"year_to": 2021, "date_to": date(2021, 6, 30)},
+])
+def test_resolve_range_rejects_mixed_styles(kwargs):
+    args = {"year": None, "year_from": None, "year_to": None, "date_from": None, "date_to": None, **kwargs}
+    with pytest.raises(HTTPException) as exc:
+        _resolve_range(**args)
+    assert exc.value.status_code == 422
+
+# -------- endpoints contra SQLite (YEAR/QUARTER registradas como funciones) --------
+@pytest.fixture
+def client():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _mysql_funcs(conn, _):
+        conn.create_function("YEAR", 1, lambda s: int(s[:4]))
+        conn.create_function("QUARTER", 1, lambda s: (int(s[5:7]) - 1) // 3 + 1)
+
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    hires = {  # (department_id, year): cantidad
+        (1, 2019): 5, (2, 2019): 1, (3, 2019): 1,
+        (1, 2021): 1, (2, 2021): 4, (3, 2021): 1,
+    }
+    with Session() as db:
+        db.add_all([Department(id=i, name=f"D{i}") for i in (1, 2, 3)] + [Job(id=1, title="J1")])
+        n = 0
+        for (dep, y), count in hires.items():
+            for _ in range(count):
+                n += 1
+                db.add(Employee(id=n, first_name=f"N{n}", last_name="L",
+                                hire_date=date(y, 1 + n % 12, 1), department_id=dep, job_id=1))
+        db.commit()
+
+    def override():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+def test_hired_per_quarter_keyed_by_year_with_empty_years(client):
+    body = client.get("/api/v1/metrics/hired-per-quarter", params={"year_from": 2019, "year_to": 2021}).json()
+    assert list(body) == ["2019", "2020", "2021"]
+    assert body["2020"] == []
+    d1 = next(r for r in body["2019"] if r["department"] == "D1")
+    assert d1["Q1"] + d1["Q2"] + d1["Q3"] + d1["Q4"] == 5
+
+def test_departments_above_mean_per_year(client):
+    body = client.get("/api/v1/metrics/departments-above-mean", params={"year_from": 2019, "year_to": 2021}).json()
+    assert [r["id"] for r in body["2019"]] == [1]
+    assert body["2020"] == []
+    assert [r["id"] for r in body["2021"]] == [2]
+
+def test_departments_above_mean_department_filter_keeps_global_mean(client):
+    params = {"year_from": 2019, "year_to": 2021, "department_id": 1}
+    body = client.get("/api/v1/metrics/departments-above-mean", params=params).json()
+    assert [r["id"] for r in body["2019"]] == [1]
+    assert body["2021"] == []
+
+def test_metrics_reject_mixed_range_params(client):
+    r = client.get("/api/v1/metrics/hired-per-quarter", params={"year": 2021, "year_from": 2019})
+    assert r.status_code == 422
@@ -0,0 +1,76 @@
+# tests/test_ratelimit.py
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.config import Settings
+from app.core.ratelimit import KeyedLimiter, RateLimitMiddleware
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    lim = KeyedLimiter(rate=2, burst=2, max_concurrency=0, clock=clock)
+    assert lim.acquire("k") is None
+    assert lim.acquire("k") is None
+    assert lim.acquire("k") == 0.5
+    clock.now = 0.5
+    assert lim.acquire("k") is None
+
+def test_keys_are_independent():
+    lim = KeyedLimiter(rate=1, burst=1, max_concurrency=0, clock=FakeClock())
+    assert lim.acquire("a") is None
+    assert lim.acquire("a") is not None
+    assert lim.acquire("b") is None
+
+def test_concurrency_limit_released():
+    lim = KeyedLimiter(rate=0, burst=1, max_concurrency=1)
+    assert lim.acquire("k") is None
+    assert lim.acquire("k") is not None
+    lim.release("k")
+    assert lim.acquire("k") is None
+
+def test_eviction_skips_keys_in_flight():
+    lim = KeyedLimiter(rate=0, burst=1, max_concurrency=1, max_keys=2)
+    assert lim.acquire("victim") is None
+    assert lim.acquire("x1") is None
+    lim.release("x1")
+    assert lim.acquire("x2") is None      # desaloja x1 (ociosa), no victim
+    assert lim.acquire("victim") is not None
+    assert lim.acquire("x3") is not None  # ninguna ociosa: se rechaza
+
+def _limited_client(**overrides):
+    app = FastAPI()
+
+    @app.get("/api/v1/ingestion/ping")
+    def ping():
+        return {"msg": "ok"}
+
+    settings = Settings(API_KEY="good", API_KEYS=["other"], INGESTION_RATE_PER_SEC=0.001, INGESTION_BURST=1, **overrides)
+    app.add_middleware(RateLimitMiddleware, settings=settings)
+    return TestClient(app)
+
+def test_middleware_rejects_with_retry_after():
+    client = _limited_client()
+    assert client.get("/api/v1/ingestion/ping", headers={"X-API-Key": "good"}).status_code == 200
+    r = client.get("/api/v1/ingestion/ping", headers={"X-API-Key": "good"})
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+    # sin key válida se usa el bucket "anonymous", independiente del de la key
+    assert client.get("/api/v1/ingestion/ping").status_code == 200
+
+def test_each_api_key_has_its_own_bucket():
+    client = _limited_client()
+    assert client.get("/api/v1/ingestion/ping", headers={"X-API-Key": "good"}).status_code == 200
+    assert client.get("/api/v1/ingestion/ping", headers={"X-API-Key": "good"}).status_code == 429
+    # un productor agresivo con "good" no agota la capacidad de "other"
+    assert client.get("/api/v1/ingestion/ping", headers={"X-API-Key": "other"}).status_code == 200
+
+def test_made_up_keys_share_the_anonymous_bucket():
+    client = _limited_client()
+    assert client.get("/api/v1/ingestion/ping", headers={"X-API-Key": "junk0"}).status_code == 200
+    for i in range(1, 5):
+        r = client.get("/api/v1/ingestion/ping", headers={"X-API-Key": f"junk{i}"})
+        assert r.status_code == 429